@@ -4,201 +4,322 @@
 
 import adsk.core
 import adsk.fusion
-import traceback
-import os
-import json
 import re
-import math
-import threading
+import itertools
+import functools
+import operator
 import time
-from typing import List, Dict, Optional, Tuple, Any
-import urllib.request
-import urllib.parse
+from array import array
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import List, Dict, Optional, Tuple, Any, Mapping
+# json and traceback are imported where used, keeping add-in startup lean
 
-# Global handlers storage
+# Global handlers storage; Fusion only keeps handlers alive while Python holds them
 _handlers = []
 _app = None
 _ui = None
 
-# Add-in Configuration
-CONFIG = {
-    'ID': 'AIBodyRenamerRevolution',
-    'NAME': '🤖 AI Body Renamer',
-    'DESCRIPTION': 'Revolutionary AI-powered body naming with zero effort',
-    'COMMAND_ID': 'AIBodyRenamerCmd',
-    'PANEL_ID': 'AIBodyRenamerPanel',
-    'VERSION': '2.0.0',
-    'TOOLTIP': 'AI-powered body renaming - Just think it, AI does it!'
-}
+# Add-in Configuration; frozen so handlers read plain attributes and nothing can mutate it
+@dataclass(frozen=True, slots=True)
+class _Config:
+    ID: str
+    NAME: str
+    DESCRIPTION: str
+    COMMAND_ID: str
+    PANEL_ID: str
+    VERSION: str
+    TOOLTIP: str
+    SHOW_STARTUP_BANNER: bool
+
+CONFIG = _Config(
+    ID='AIBodyRenamerRevolution',
+    NAME='🤖 AI Body Renamer',
+    DESCRIPTION='Revolutionary AI-powered body naming with zero effort',
+    COMMAND_ID='AIBodyRenamerCmd',
+    PANEL_ID='AIBodyRenamerPanel',
+    VERSION='2.0.0',
+    TOOLTIP='AI-powered body renaming - Just think it, AI does it!',
+    SHOW_STARTUP_BANNER=True
+)
+
+# Rename table rows created up front and per "show more" click; each row is 4 API inputs
+MAX_INLINE_ROWS = 50
+
+# Renames above this count show a progress dialog and pump UI events while applying
+PROGRESS_MIN_RENAMES = 50
+PROGRESS_UPDATE_EVERY = 10
+
+# Analysis cache: body entity token -> (revision id, properties), for the current design's bodies
+_ANALYSIS_CACHE: Dict[Any, Tuple[Any, Dict[str, Any]]] = {}
+
+# Recently generated name lists (LRU): (category, body signatures) -> names
+SUGGESTION_CACHE_SIZE = 32
+_SUGGESTION_CACHE: 'OrderedDict[Tuple, Tuple[str, ...]]' = OrderedDict()
 
 class AdvancedBodyAnalyzer:
     """Advanced body analysis using geometric and spatial properties"""
     
+    @staticmethod
+    def _cache_key(body) -> Tuple[Any, Any]:
+        """Identify a body and its geometry revision for the analysis cache"""
+        key = getattr(body, 'entityToken', None) or id(body)
+        version = getattr(body, 'revisionId', None)
+        return key, version
+    
+    @staticmethod
+    def _snapshot(body) -> Tuple[float, ...]:
+        """Read the raw scalars needed for analysis (Fusion API calls, UI thread only)"""
+        # Every BRepBody has these, so no hasattr() probes; other entities raise AttributeError
+        bbox = body.boundingBox
+        # asArray() fetches all three coordinates in one call instead of three
+        min_x, min_y, min_z = bbox.minPoint.asArray()
+        max_x, max_y, max_z = bbox.maxPoint.asArray()
+        phys_props = body.physicalProperties
+        return (min_x, min_y, min_z, max_x, max_y, max_z, body.faces.count,
+                phys_props.volume, phys_props.area, phys_props.mass)
+    
+    @staticmethod
+    def _derive(raw: Tuple[float, ...]) -> Dict[str, Any]:
+        """Derive the body characteristics from a snapshot (pure Python, no API access)"""
+        min_x, min_y, min_z, max_x, max_y, max_z, face_count, volume, area, mass = raw
+        
+        # Dimensions
+        width = abs(max_x - min_x)
+        height = abs(max_y - min_y)
+        depth = abs(max_z - min_z)
+        max_dim = max(width, height, depth)
+        min_dim = min(width, height, depth)
+        
+        # Position
+        center_x = (min_x + max_x) * 0.5
+        center_y = (min_y + max_y) * 0.5
+        center_z = (min_z + max_z) * 0.5
+        
+        return {
+            'volume': volume,
+            'area': area,
+            'mass': mass,
+            'width': width,
+            'height': height,
+            'depth': depth,
+            'max_dimension': max_dim,
+            'min_dimension': min_dim,
+            'aspect_ratio': max_dim / (min_dim + 0.001),
+            'is_long_thin': max_dim > 3 * min_dim,
+            'is_cubic': abs(width - height) < 0.1 * width and abs(width - depth) < 0.1 * width,
+            'is_flat': min_dim < 0.1 * max_dim,
+            'face_count': face_count,
+            'complexity': 'simple' if face_count < 10 else 'complex' if face_count < 50 else 'very_complex',
+            'center_x': center_x,
+            'center_y': center_y,
+            'center_z': center_z,
+            'is_centered': abs(center_x) < 1 and abs(center_y) < 1,
+            'quadrant': 'positive' if center_x > 0 and center_y > 0 else 'negative'
+        }
+    
     @staticmethod
     def analyze_body_characteristics(body) -> Dict[str, Any]:
         """Extract comprehensive body characteristics for AI analysis"""
-        try:
-            properties = {}
-            
-            # Basic properties
-            if hasattr(body, 'physicalProperties'):
-                phys_props = body.physicalProperties
-                properties.update({
-                    'volume': phys_props.volume if hasattr(phys_props, 'volume') else 0,
-                    'area': phys_props.area if hasattr(phys_props, 'area') else 0,
-                    'mass': phys_props.mass if hasattr(phys_props, 'mass') else 0,
-                })
-            
-            # Bounding box analysis
-            if hasattr(body, 'boundingBox'):
-                bbox = body.boundingBox
-                if bbox:
-                    width = abs(bbox.maxPoint.x - bbox.minPoint.x)
-                    height = abs(bbox.maxPoint.y - bbox.minPoint.y)
-                    depth = abs(bbox.maxPoint.z - bbox.minPoint.z)
-                    
-                    properties.update({
-                        'width': width,
-                        'height': height,
-                        'depth': depth,
-                        'max_dimension': max(width, height, depth),
-                        'min_dimension': min(width, height, depth),
-                        'aspect_ratio': max(width, height, depth) / (min(width, height, depth) + 0.001),
-                        'is_long_thin': max(width, height, depth) > 3 * min(width, height, depth),
-                        'is_cubic': abs(width - height) < 0.1 * width and abs(width - depth) < 0.1 * width,
-                        'is_flat': min(width, height, depth) < 0.1 * max(width, height, depth)
-                    })
-            
-            # Face and edge analysis
-            if hasattr(body, 'faces'):
-                face_count = body.faces.count
-                properties['face_count'] = face_count
-                properties['complexity'] = 'simple' if face_count < 10 else 'complex' if face_count < 50 else 'very_complex'
-            
-            # Position analysis
-            if hasattr(body, 'boundingBox') and body.boundingBox:
-                center = body.boundingBox.minPoint.copy()
-                center.translateBy(body.boundingBox.maxPoint.vectorTo(body.boundingBox.minPoint).copy())
-                center.scaleBy(0.5)
-                
-                properties.update({
-                    'center_x': center.x,
-                    'center_y': center.y,
-                    'center_z': center.z,
-                    'is_centered': abs(center.x) < 1 and abs(center.y) < 1,
-                    'quadrant': 'positive' if center.x > 0 and center.y > 0 else 'negative'
-                })
-            
-            return properties
+        return AdvancedBodyAnalyzer.analyze_bodies_bulk([body])[0]
+    
+    @staticmethod
+    def analyze_bodies_bulk(bodies, prune: bool = False) -> List[Dict[str, Any]]:
+        """Analyze many bodies at once: all API reads first, then the pure-Python derivation"""
+        results: List[Optional[Dict[str, Any]]] = [None] * len(bodies)
+        
+        # Cached bodies short-circuit; only the rest touch the API
+        snapshots = []
+        live = set()
+        for i, body in enumerate(bodies):
+            key, version = AdvancedBodyAnalyzer._cache_key(body)
+            live.add(key)
+            cached = _ANALYSIS_CACHE.get(key) if version is not None else None
+            if cached is not None and cached[0] == version:
+                results[i] = cached[1]
+                continue
             
-        except Exception as e:
-            return {'error': str(e), 'analysis_failed': True}
+            try:
+                snapshots.append((i, key, version, AdvancedBodyAnalyzer._snapshot(body)))
+            except AttributeError:
+                results[i] = {'error': 'unsupported body', 'analysis_failed': True}
+            except Exception as e:
+                results[i] = {'error': str(e), 'analysis_failed': True}
+        
+        # Derivation needs no API access, so it runs as one tight loop
+        for i, key, version, raw in snapshots:
+            properties = AdvancedBodyAnalyzer._derive(raw)
+            if version is not None:
+                _ANALYSIS_CACHE[key] = (version, properties)
+            results[i] = properties
+        
+        # Pruning keeps only these bodies' analyses, bounding the cache to one design
+        if prune:
+            for key in _ANALYSIS_CACHE.keys() - live:
+                del _ANALYSIS_CACHE[key]
+        
+        return results
+
+# User hint keywords, in priority order: the first category with a match wins
+_HINT_KEYWORDS = (
+    ('automotive', ('car', 'auto', 'engine', 'brake', 'wheel')),
+    ('electronics', ('circuit', 'pcb', 'electronic', 'connector')),
+    ('furniture', ('table', 'chair', 'drawer', 'furniture')),
+    ('architecture', ('building', 'beam', 'column', 'wall')),
+    ('mechanical_advanced', ('gear', 'shaft', 'bearing', 'machine')),
+    ('fasteners', ('bolt', 'screw', 'nut', 'fastener'))
+)
+_HINT_CATEGORY = {word: category for category, words in _HINT_KEYWORDS for word in words}
+_HINT_PRIORITY = {category: rank for rank, (category, _) in enumerate(_HINT_KEYWORDS)}
+# Lookahead reports overlapping keywords too, matching plain substring tests
+_HINT_REGEX = re.compile('(?=(' + '|'.join(map(re.escape, _HINT_CATEGORY)) + '))')
+
+# Name keywords that make a base name a good fit for a body trait
+_NAME_TAG_WORDS = {
+    'large': ('large', 'main'),
+    'small': ('small', 'mini'),
+    'long_thin': ('shaft', 'rod', 'bar', 'beam'),
+    'cubic': ('block', 'cube', 'housing'),
+    'flat': ('plate', 'panel', 'cover', 'top'),
+    'complex': ('housing', 'assembly')
+}
+
+# Comprehensive naming patterns for different industries and contexts
+_PATTERNS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    'mechanical_basic': (
+        'Shaft', 'Gear', 'Bearing', 'Pulley', 'Sprocket', 'Coupling', 'Bushing', 'Washer',
+        'Housing', 'Cover', 'Base', 'Frame', 'Bracket', 'Mount', 'Support', 'Clamp'
+    ),
+    'mechanical_advanced': (
+        'Drive Shaft', 'Input Gear', 'Output Gear', 'Bearing Race', 'Timing Pulley',
+        'Chain Sprocket', 'Flexible Coupling', 'Linear Bushing', 'Spring Washer',
+        'Motor Housing', 'Access Cover', 'Mounting Base', 'Main Frame'
+    ),
+    'fasteners': (
+        'Hex Bolt', 'Cap Screw', 'Socket Head', 'Flat Head', 'Pan Head', 'Button Head',
+        'Hex Nut', 'Lock Nut', 'Wing Nut', 'Threaded Rod', 'Dowel Pin', 'Spring Pin'
+    ),
+    'automotive': (
+        'Engine Block', 'Cylinder Head', 'Piston', 'Connecting Rod', 'Crankshaft',
+        'Brake Disc', 'Brake Caliper', 'Suspension Arm', 'Control Arm', 'Steering Knuckle',
+        'Body Panel', 'Door Frame', 'Window Frame', 'Bumper', 'Fender', 'Hood'
+    ),
+    'electronics': (
+        'PCB Main', 'PCB Control', 'Connector Housing', 'Terminal Block', 'Heat Sink',
+        'Enclosure', 'Front Panel', 'Back Panel', 'Display Mount', 'Button Cap',
+        'LED Holder', 'Switch Housing', 'Cable Clamp', 'Strain Relief'
+    ),
+    'furniture': (
+        'Table Top', 'Table Leg', 'Drawer Front', 'Drawer Side', 'Drawer Back',
+        'Handle', 'Knob', 'Hinge', 'Shelf', 'Side Panel', 'Back Panel',
+        'Cushion Base', 'Armrest', 'Headrest', 'Caster', 'Support Bar'
+    ),
+    'architecture': (
+        'Main Beam', 'Support Beam', 'Column', 'Wall Panel', 'Floor Slab',
+        'Roof Beam', 'Rafter', 'Joist', 'Stud', 'Header', 'Sill Plate',
+        'Foundation', 'Footing', 'Window Frame', 'Door Frame'
+    )
+})
+
+# Intelligent context detection rules
+_CONTEXT_RULES: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    'size_rules': MappingProxyType({
+        'very_small': lambda props: props.get('max_dimension', 0) < 10,
+        'small': lambda props: 10 <= props.get('max_dimension', 0) < 50,
+        'medium': lambda props: 50 <= props.get('max_dimension', 0) < 200,
+        'large': lambda props: 200 <= props.get('max_dimension', 0) < 1000,
+        'very_large': lambda props: props.get('max_dimension', 0) >= 1000
+    }),
+    'shape_rules': MappingProxyType({
+        'cylindrical': lambda props: props.get('aspect_ratio', 1) > 3 and props.get('face_count', 0) > 10,
+        'cubic': lambda props: props.get('is_cubic', False),
+        'flat': lambda props: props.get('is_flat', False),
+        'complex': lambda props: props.get('complexity') == 'complex'
+    })
+})
+
+def _tag_names(names: Tuple[str, ...]) -> Dict[str, frozenset]:
+    """Index which names carry each trait keyword, so scoring needs no substring scans"""
+    lowered = [name.lower() for name in names]
+    tags = {tag: {i for i, name in enumerate(lowered) if any(word in name for word in words)}
+            for tag, words in _NAME_TAG_WORDS.items()}
+    # Size keywords are exclusive: 'large' takes precedence over 'small'
+    tags['small'] -= tags['large']
+    return {tag: frozenset(indices) for tag, indices in tags.items()}
+
+def _weight_rows(names: Tuple[str, ...]) -> Tuple[Tuple[int, ...], ...]:
+    """Encode each name's scoring bonuses and penalties as a row of feature weights"""
+    # Row layout: (bias, is_large, is_small, is_long_thin, is_cubic, is_flat, is_complex)
+    tags = _tag_names(names)
+    rows = []
+    for i in range(len(names)):
+        bias = big = small = 0
+        # Size names earn +10 when the size fits and -5 otherwise
+        if i in tags['large']:
+            bias, big = -5, 15
+        elif i in tags['small']:
+            bias, small = -5, 15
+        rows.append((bias, big, small,
+                     15 if i in tags['long_thin'] else 0,
+                     15 if i in tags['cubic'] else 0,
+                     15 if i in tags['flat'] else 0,
+                     10 if i in tags['complex'] else 0))
+    return tuple(rows)
+
+_NAME_WEIGHTS = MappingProxyType({category: _weight_rows(names) for category, names in _PATTERNS.items()})
 
 class IntelligentNamingEngine:
     """AI-powered naming engine with pattern recognition"""
     
     def __init__(self):
-        self.naming_patterns = self._load_advanced_patterns()
-        self.context_rules = self._create_context_rules()
-        
-    def _load_advanced_patterns(self) -> Dict[str, List[str]]:
-        """Load comprehensive naming patterns for different industries and contexts"""
-        return {
-            'mechanical_basic': [
-                'Shaft', 'Gear', 'Bearing', 'Pulley', 'Sprocket', 'Coupling', 'Bushing', 'Washer',
-                'Housing', 'Cover', 'Base', 'Frame', 'Bracket', 'Mount', 'Support', 'Clamp'
-            ],
-            'mechanical_advanced': [
-                'Drive Shaft', 'Input Gear', 'Output Gear', 'Bearing Race', 'Timing Pulley',
-                'Chain Sprocket', 'Flexible Coupling', 'Linear Bushing', 'Spring Washer',
-                'Motor Housing', 'Access Cover', 'Mounting Base', 'Main Frame'
-            ],
-            'fasteners': [
-                'Hex Bolt', 'Cap Screw', 'Socket Head', 'Flat Head', 'Pan Head', 'Button Head',
-                'Hex Nut', 'Lock Nut', 'Wing Nut', 'Threaded Rod', 'Dowel Pin', 'Spring Pin'
-            ],
-            'automotive': [
-                'Engine Block', 'Cylinder Head', 'Piston', 'Connecting Rod', 'Crankshaft',
-                'Brake Disc', 'Brake Caliper', 'Suspension Arm', 'Control Arm', 'Steering Knuckle',
-                'Body Panel', 'Door Frame', 'Window Frame', 'Bumper', 'Fender', 'Hood'
-            ],
-            'electronics': [
-                'PCB Main', 'PCB Control', 'Connector Housing', 'Terminal Block', 'Heat Sink',
-                'Enclosure', 'Front Panel', 'Back Panel', 'Display Mount', 'Button Cap',
-                'LED Holder', 'Switch Housing', 'Cable Clamp', 'Strain Relief'
-            ],
-            'furniture': [
-                'Table Top', 'Table Leg', 'Drawer Front', 'Drawer Side', 'Drawer Back',
-                'Handle', 'Knob', 'Hinge', 'Shelf', 'Side Panel', 'Back Panel',
-                'Cushion Base', 'Armrest', 'Headrest', 'Caster', 'Support Bar'
-            ],
-            'architecture': [
-                'Main Beam', 'Support Beam', 'Column', 'Wall Panel', 'Floor Slab',
-                'Roof Beam', 'Rafter', 'Joist', 'Stud', 'Header', 'Sill Plate',
-                'Foundation', 'Footing', 'Window Frame', 'Door Frame'
-            ]
-        }
-    
-    def _create_context_rules(self) -> Dict[str, Any]:
-        """Create intelligent context detection rules"""
-        return {
-            'size_rules': {
-                'very_small': lambda props: props.get('max_dimension', 0) < 10,
-                'small': lambda props: 10 <= props.get('max_dimension', 0) < 50,
-                'medium': lambda props: 50 <= props.get('max_dimension', 0) < 200,
-                'large': lambda props: 200 <= props.get('max_dimension', 0) < 1000,
-                'very_large': lambda props: props.get('max_dimension', 0) >= 1000
-            },
-            'shape_rules': {
-                'cylindrical': lambda props: props.get('aspect_ratio', 1) > 3 and props.get('face_count', 0) > 10,
-                'cubic': lambda props: props.get('is_cubic', False),
-                'flat': lambda props: props.get('is_flat', False),
-                'complex': lambda props: props.get('complexity') == 'complex'
-            }
-        }
+        # Shared, read-only tables built once at import time
+        self.naming_patterns = _PATTERNS
+        self.context_rules = _CONTEXT_RULES
+        self._name_weights = _NAME_WEIGHTS
     
     def analyze_design_context(self, bodies_data: List[Dict]) -> str:
         """Analyze all bodies to determine the overall design context"""
         if not bodies_data:
             return 'general'
         
-        # Count different characteristics
-        contexts = {
-            'mechanical': 0,
-            'automotive': 0,
-            'electronics': 0,
-            'furniture': 0,
-            'architecture': 0
-        }
+        # Count different characteristics in locals, one dict read per property
+        mechanical = automotive = electronics = furniture = architecture = 0
         
         for body_data in bodies_data:
             props = body_data.get('properties', {})
             
             # Size-based classification
             max_dim = props.get('max_dimension', 0)
-            complexity = props.get('complexity', 'simple')
-            
             if max_dim > 1000:  # Large structures
-                contexts['architecture'] += 2
+                architecture += 2
             elif max_dim < 10:  # Small precision parts
-                contexts['electronics'] += 2
-                contexts['mechanical'] += 1
+                electronics += 2
+                mechanical += 1
             elif 50 < max_dim < 500:  # Medium parts
-                contexts['automotive'] += 1
-                contexts['mechanical'] += 1
-                contexts['furniture'] += 1
+                automotive += 1
+                mechanical += 1
+                furniture += 1
             
             # Shape-based classification
             if props.get('is_long_thin', False):
-                contexts['mechanical'] += 1
+                mechanical += 1
             if props.get('face_count', 0) > 20:
-                contexts['automotive'] += 1
+                automotive += 1
             if props.get('is_flat', False):
-                contexts['furniture'] += 1
-                contexts['electronics'] += 1
+                furniture += 1
+                electronics += 1
+        
+        contexts = {
+            'mechanical': mechanical,
+            'automotive': automotive,
+            'electronics': electronics,
+            'furniture': furniture,
+            'architecture': architecture
+        }
         
         # Return the context with highest score
-        return max(contexts.keys(), key=lambda k: contexts[k])
+        return max(contexts, key=contexts.__getitem__)
     
     def generate_intelligent_names(self, bodies_data: List[Dict], user_hint: str = "") -> List[str]:
         """Generate intelligent names based on body analysis and user hints"""
@@ -212,107 +333,98 @@ class IntelligentNamingEngine:
         suggested_category = self._process_user_hint(user_hint, context)
         
         # Get appropriate naming pattern
-        base_names = self.naming_patterns.get(suggested_category, 
-                                             self.naming_patterns.get(context + '_basic',
-                                                                    self.naming_patterns['mechanical_basic']))
+        if suggested_category in self.naming_patterns:
+            category = suggested_category
+        elif context + '_basic' in self.naming_patterns:
+            category = context + '_basic'
+        else:
+            category = 'mechanical_basic'
+        
+        # Sort keys for logical naming by size and position
+        all_props = [bd.get('properties', {}) for bd in bodies_data]
+        sort_keys = [(props.get('max_dimension', 0), props.get('center_x', 0)) for props in all_props]
+        
+        # Unchanged designs reuse the names generated on an earlier click; the
+        # signature holds exactly what the names depend on, so hits are exact
+        signature = (category, tuple(
+            (sort_key, self._feature_key(props) if props else None)
+            for sort_key, props in zip(sort_keys, all_props)))
+        cached = _SUGGESTION_CACHE.get(signature)
+        if cached is not None:
+            _SUGGESTION_CACHE.move_to_end(signature)
+            return list(cached)
         
         # Generate names based on body characteristics
-        generated_names = []
+        generated_names = [''] * len(bodies_data)
         name_counters = {}
         
         # Sort bodies by size and position for logical naming
-        sorted_bodies = sorted(enumerate(bodies_data), 
-                             key=lambda x: (x[1].get('properties', {}).get('max_dimension', 0),
-                                          x[1].get('properties', {}).get('center_x', 0)))
+        order = sorted(range(len(all_props)), key=sort_keys.__getitem__)
         
-        for original_idx, body_data in sorted_bodies:
-            props = body_data.get('properties', {})
-            
-            # Select appropriate base name
-            base_name = self._select_best_name(props, base_names, name_counters)
-            
-            # Add counter if needed
-            if base_name not in name_counters:
-                name_counters[base_name] = 0
-            name_counters[base_name] += 1
-            
-            # Create final name
-            if sum(1 for name in [self._select_best_name(bd.get('properties', {}), base_names, {}) 
-                                for _, bd in sorted_bodies] if name == base_name) > 1:
+        # Select each body's base name once, then count repeats in a single pass
+        selected = [self._select_best_name(all_props[i], category) for i in order]
+        name_freq = Counter(selected)
+        
+        for original_idx, base_name in zip(order, selected):
+            # Add counter only to names shared by several bodies
+            if name_freq[base_name] > 1:
+                name_counters[base_name] = name_counters.get(base_name, 0) + 1
                 final_name = f"{base_name} {name_counters[base_name]}"
             else:
                 final_name = base_name
             
-            generated_names.append((original_idx, final_name))
+            # Place directly at the body's original position
+            generated_names[original_idx] = final_name
+        
+        _SUGGESTION_CACHE[signature] = tuple(generated_names)
+        if len(_SUGGESTION_CACHE) > SUGGESTION_CACHE_SIZE:
+            _SUGGESTION_CACHE.popitem(last=False)
         
-        # Sort back to original order
-        generated_names.sort(key=lambda x: x[0])
-        return [name for _, name in generated_names]
+        return generated_names
     
     def _process_user_hint(self, hint: str, default_context: str) -> str:
         """Process user hint to determine naming category"""
         if not hint:
             return default_context + '_basic'
         
-        hint_lower = hint.lower()
-        
-        # Keyword matching
-        if any(word in hint_lower for word in ['car', 'auto', 'engine', 'brake', 'wheel']):
-            return 'automotive'
-        elif any(word in hint_lower for word in ['circuit', 'pcb', 'electronic', 'connector']):
-            return 'electronics'
-        elif any(word in hint_lower for word in ['table', 'chair', 'drawer', 'furniture']):
-            return 'furniture'
-        elif any(word in hint_lower for word in ['building', 'beam', 'column', 'wall']):
-            return 'architecture'
-        elif any(word in hint_lower for word in ['gear', 'shaft', 'bearing', 'machine']):
-            return 'mechanical_advanced'
-        elif any(word in hint_lower for word in ['bolt', 'screw', 'nut', 'fastener']):
-            return 'fasteners'
+        # Keyword matching in one regex pass; highest-priority category wins
+        matches = {_HINT_CATEGORY[m.group(1)] for m in _HINT_REGEX.finditer(hint.lower())}
+        if matches:
+            return min(matches, key=_HINT_PRIORITY.__getitem__)
         
         return default_context + '_basic'
     
-    def _select_best_name(self, props: Dict, base_names: List[str], used_names: Dict) -> str:
+    def _select_best_name(self, props: Dict, category: str) -> str:
         """Select the most appropriate name based on body properties"""
+        base_names = self.naming_patterns[category]
         if not props or not base_names:
             return base_names[0] if base_names else 'Component'
         
-        # Score each potential name
-        scores = {}
-        for name in base_names:
-            score = 0
-            name_lower = name.lower()
-            
-            # Size-based scoring
-            max_dim = props.get('max_dimension', 0)
-            if 'large' in name_lower or 'main' in name_lower:
-                score += 10 if max_dim > 100 else -5
-            elif 'small' in name_lower or 'mini' in name_lower:
-                score += 10 if max_dim < 50 else -5
-            
-            # Shape-based scoring
-            if props.get('is_long_thin', False):
-                if any(word in name_lower for word in ['shaft', 'rod', 'bar', 'beam']):
-                    score += 15
-            
-            if props.get('is_cubic', False):
-                if any(word in name_lower for word in ['block', 'cube', 'housing']):
-                    score += 15
-            
-            if props.get('is_flat', False):
-                if any(word in name_lower for word in ['plate', 'panel', 'cover', 'top']):
-                    score += 15
-            
-            # Complexity-based scoring
-            complexity = props.get('complexity', 'simple')
-            if complexity == 'complex' and any(word in name_lower for word in ['housing', 'assembly']):
-                score += 10
-            
-            scores[name] = score
+        # Bodies with the same scoring traits always get the same name
+        return self._select_best_name_cached(self._feature_key(props), category)
+    
+    @staticmethod
+    def _feature_key(props: Dict) -> Tuple[int, bool, bool, bool, bool]:
+        """Reduce body properties to just the traits that affect name scoring"""
+        max_dim = props.get('max_dimension', 0)
+        # Scoring only distinguishes max_dim < 50, 50..100 and > 100
+        size_bucket = 0 if max_dim < 50 else 2 if max_dim > 100 else 1
+        return (size_bucket,
+                bool(props.get('is_long_thin', False)),
+                bool(props.get('is_cubic', False)),
+                bool(props.get('is_flat', False)),
+                props.get('complexity', 'simple') == 'complex')
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _select_best_name_cached(feature_key: Tuple[int, bool, bool, bool, bool], category: str) -> str:
+        """Score every name in a pattern for one feature key"""
+        size_bucket, is_long_thin, is_cubic, is_flat, is_complex = feature_key
+        features = (1, size_bucket == 2, size_bucket == 0, is_long_thin, is_cubic, is_flat, is_complex)
         
-        # Return name with highest score
-        best_name = max(scores.keys(), key=lambda k: scores[k])
-        return best_name
+        # One integer dot product per name; ties go to the earliest name
+        scores = [sum(map(operator.mul, weights, features)) for weights in _NAME_WEIGHTS[category]]
+        return _PATTERNS[category][scores.index(max(scores))]
 
 class AIBodyRenamerRevolution:
     """Revolutionary AI-powered body renamer with advanced features"""
@@ -338,35 +450,36 @@ class AIBodyRenamerRevolution:
             self.bodies = []
             bodies_data = []
             
-            # Collect all visible bodies
-            for body in root_comp.bRepBodies:
-                if body.isVisible:
-                    self.bodies.append(body)
-                    
-            # Collect from all occurrences
-            for occurrence in root_comp.allOccurrences:
-                if hasattr(occurrence.component, 'bRepBodies'):
-                    for body in occurrence.component.bRepBodies:
-                        if body.isVisible:
+            # Collect all visible bodies from the root and every occurrence;
+            # components referenced by several occurrences are only taken once
+            seen = set()
+            body_collections = itertools.chain(
+                [root_comp.bRepBodies],
+                (component.bRepBodies for component in
+                 (occurrence.component for occurrence in root_comp.allOccurrences) if component))
+            for collection in body_collections:
+                for body in collection:
+                    if body.isVisible:
+                        token = body.entityToken
+                        if token not in seen:
+                            seen.add(token)
                             self.bodies.append(body)
             
-            # Analyze each body
-            for i, body in enumerate(self.bodies):
+            # Analyze all bodies in one batch, forgetting bodies that were deleted
+            # or belong to previously opened designs
+            all_properties = self.analyzer.analyze_bodies_bulk(self.bodies, prune=True)
+            for i, (body, properties) in enumerate(zip(self.bodies, all_properties)):
+                # Only format the fallback name when it is actually needed
                 try:
-                    properties = self.analyzer.analyze_body_characteristics(body)
-                    bodies_data.append({
-                        'index': i,
-                        'name': getattr(body, 'name', f'Body_{i}'),
-                        'body': body,
-                        'properties': properties
-                    })
-                except Exception as e:
-                    bodies_data.append({
-                        'index': i,
-                        'name': getattr(body, 'name', f'Body_{i}'),
-                        'body': body,
-                        'properties': {'error': str(e)}
-                    })
+                    name = body.name
+                except AttributeError:
+                    name = f'Body_{i}'
+                bodies_data.append({
+                    'index': i,
+                    'name': name,
+                    'body': body,
+                    'properties': properties
+                })
             
             return bodies_data
             
@@ -374,6 +487,45 @@ class AIBodyRenamerRevolution:
             self.show_error(f"Error analyzing bodies: {str(e)}")
             return []
     
+    def apply_renames(self, renames: List[Tuple[int, Any, str]]) -> Tuple[int, List[Tuple[int, Exception]], int]:
+        """Apply (index, body, new_name) renames in one pass; returns the count, errors and skipped count"""
+        # Execute already runs inside a single command transaction (one undo step),
+        # and renames add no timeline features, so all that is left is a tight write loop
+        if self.ui and renames:
+            self.ui.activeSelections.clear()  # Avoid selection highlight updates per rename
+        
+        # Renames must happen on the UI thread inside this transaction, so large
+        # batches keep Fusion responsive by reporting progress and pumping events
+        progress = None
+        if self.ui and len(renames) >= PROGRESS_MIN_RENAMES:
+            progress = self.ui.createProgressDialog()
+            progress.isCancelButtonShown = True
+            progress.show('🤖 AI Body Renamer', 'Renaming bodies... %v of %m', 0, len(renames), 1)
+        
+        renamed_count = 0
+        skipped_count = 0
+        errors = []
+        try:
+            for done, (i, body, new_name) in enumerate(renames, 1):
+                try:
+                    if body.name != new_name:
+                        body.name = new_name
+                        renamed_count += 1
+                except Exception as e:
+                    errors.append((i, e))
+                
+                if progress and done % PROGRESS_UPDATE_EVERY == 0:
+                    progress.progressValue = done
+                    adsk.doEvents()
+                    if progress.wasCancelled:
+                        skipped_count = len(renames) - done
+                        break
+        finally:
+            if progress:
+                progress.hide()
+        
+        return renamed_count, errors, skipped_count
+    
     def show_error(self, message: str):
         """Show error message to user"""
         if self.ui:
@@ -389,6 +541,31 @@ class AIBodyRenamerRevolution:
         if self.ui:
             self.ui.messageBox(f"ℹ️ {message}")
 
+def _add_body_row(table, i: int, body_data: Dict):
+    """Create the rename table row for one body"""
+    row = i + 1
+    body_data['row_shown'] = True  # Execute reads this row's inputs instead of the stored suggestion
+    row_inputs = table.commandInputs
+    
+    # Current name
+    current = row_inputs.addTextBoxCommandInput(f'current_{i}', '', body_data['name'], 1, True)
+    table.addCommandInput(current, row, 0)
+    
+    # AI suggested name (current name until AI fills it in)
+    suggested = row_inputs.addStringValueInput(f'suggested_{i}', '', body_data.get('suggested', body_data['name']))
+    suggested.tooltip = f"AI suggestion for: {body_data['name']}"
+    table.addCommandInput(suggested, row, 1)
+    
+    # Preview button
+    preview_btn = row_inputs.addBoolValueInput(f'preview_{i}', '👁️', False, '', False)
+    preview_btn.tooltip = 'Preview this body in 3D viewport'
+    table.addCommandInput(preview_btn, row, 2)
+    
+    # Select checkbox
+    select_chk = row_inputs.addBoolValueInput(f'select_{i}', '', True, '', True)
+    select_chk.tooltip = 'Include this body in renaming'
+    table.addCommandInput(select_chk, row, 3)
+
 class AIRenamerCommandCreatedHandler(adsk.core.CommandCreatedEventHandler):
     """Command creation handler with revolutionary UI"""
     
@@ -454,28 +631,16 @@ class AIRenamerCommandCreatedHandler(adsk.core.CommandCreatedEventHandler):
             table.addCommandInput(results_inputs.addTextBoxCommandInput('h3', '', 'Preview', 1, True), 0, 2)
             table.addCommandInput(results_inputs.addTextBoxCommandInput('h4', '', 'Select', 1, True), 0, 3)
             
-            # Add body rows
-            for i, body_data in enumerate(bodies_data):
-                row = i + 1
-                
-                # Current name
-                current = results_inputs.addTextBoxCommandInput(f'current_{i}', '', body_data['name'], 1, True)
-                table.addCommandInput(current, row, 0)
-                
-                # AI suggested name (starts empty, filled by AI)
-                suggested = results_inputs.addStringValueInput(f'suggested_{i}', '', body_data['name'])
-                suggested.tooltip = f"AI suggestion for: {body_data['name']}"
-                table.addCommandInput(suggested, row, 1)
-                
-                # Preview button
-                preview_btn = results_inputs.addBoolValueInput(f'preview_{i}', '👁️', False, '', False)
-                preview_btn.tooltip = f'Preview this body in 3D viewport'
-                table.addCommandInput(preview_btn, row, 2)
-                
-                # Select checkbox
-                select_chk = results_inputs.addBoolValueInput(f'select_{i}', '', True, '', True)
-                select_chk.tooltip = f'Include this body in renaming'
-                table.addCommandInput(select_chk, row, 3)
+            # Add body rows; large designs get the rest on demand
+            rendered_rows = min(len(bodies_data), MAX_INLINE_ROWS)
+            for i in range(rendered_rows):
+                _add_body_row(table, i, bodies_data[i])
+            
+            if rendered_rows < len(bodies_data):
+                show_more = results_inputs.addBoolValueInput('showMoreBtn', f'⬇️ Show {MAX_INLINE_ROWS} More Bodies',
+                                                             False, '', False)
+                show_more.tooltip = (f'{len(bodies_data) - rendered_rows} more bodies are hidden. '
+                                     'Hidden bodies are still renamed with their AI suggestions.')
             
             # Advanced options
             advanced_group = inputs.addGroupCommandInput('advancedGroup', '⚙️ Advanced Options')
@@ -498,25 +663,27 @@ class AIRenamerCommandCreatedHandler(adsk.core.CommandCreatedEventHandler):
             cmd.execute.add(execute_handler)
             _handlers.append(execute_handler)
             
-            input_handler = AIRenamerInputChangedHandler(self.renamer, bodies_data)
+            input_handler = AIRenamerInputChangedHandler(self.renamer, bodies_data, rendered_rows)
             cmd.inputChanged.add(input_handler)
             _handlers.append(input_handler)
             
-            destroy_handler = AIRenamerDestroyHandler()
+            destroy_handler = AIRenamerDestroyHandler([execute_handler, input_handler])
             cmd.destroy.add(destroy_handler)
             _handlers.append(destroy_handler)
             
         except Exception as e:
             if _ui:
+                import traceback
                 _ui.messageBox(f"❌ Error creating AI interface: {str(e)}\n{traceback.format_exc()}")
 
 class AIRenamerInputChangedHandler(adsk.core.InputChangedEventHandler):
     """Handle all input changes with intelligent responses"""
     
-    def __init__(self, renamer: AIBodyRenamerRevolution, bodies_data: List[Dict]):
+    def __init__(self, renamer: AIBodyRenamerRevolution, bodies_data: List[Dict], rendered_rows: int):
         super().__init__()
         self.renamer = renamer
         self.bodies_data = bodies_data
+        self.rendered_rows = rendered_rows
         
     def notify(self, args):
         try:
@@ -525,12 +692,17 @@ class AIRenamerInputChangedHandler(adsk.core.InputChangedEventHandler):
             
             # AI Magic button
             if changed_input.id == 'magicBtn' and changed_input.value:
-                self.handle_ai_magic(inputs)
+                self.handle_ai_magic(inputs, changed_input.parentCommand.commandInputs)
                 changed_input.value = False
                 
             # Analyze button
             elif changed_input.id == 'analyzeBtn' and changed_input.value:
-                self.handle_analyze_design(inputs)
+                self.handle_analyze_design(changed_input.parentCommand.commandInputs)
+                changed_input.value = False
+                
+            # Show more rows
+            elif changed_input.id == 'showMoreBtn' and changed_input.value:
+                self.handle_show_more(inputs, changed_input)
                 changed_input.value = False
                 
             # Preview buttons
@@ -542,15 +714,15 @@ class AIRenamerInputChangedHandler(adsk.core.InputChangedEventHandler):
         except Exception as e:
             self.renamer.show_error(f"Input handling error: {str(e)}")
     
-    def handle_ai_magic(self, inputs):
+    def handle_ai_magic(self, inputs, command_inputs):
         """Handle the magical one-click AI naming"""
         try:
             # Get user prompt
             prompt_input = inputs.itemById('aiPrompt')
             user_hint = prompt_input.value if prompt_input else ""
             
-            # Show processing message
-            analysis_display = inputs.itemById('analysisResults')
+            # Show processing message; the display lives in another group than the button
+            analysis_display = command_inputs.itemById('analysisResults')
             if analysis_display:
                 analysis_display.text = "🤖 AI is analyzing your design and generating perfect names...\n⏳ Please wait..."
             
@@ -558,11 +730,15 @@ class AIRenamerInputChangedHandler(adsk.core.InputChangedEventHandler):
             suggested_names = self.renamer.naming_engine.generate_intelligent_names(
                 self.bodies_data, user_hint)
             
-            # Update the table with AI suggestions
+            # Update the table with AI suggestions; rows not created yet pick them up later.
+            # args.inputs only holds the button's own group, so find the table via the command
+            table = command_inputs.itemById('smartTable')
             for i, name in enumerate(suggested_names):
-                suggested_input = inputs.itemById(f'suggested_{i}')
-                if suggested_input:
-                    suggested_input.value = name
+                self.bodies_data[i]['suggested'] = name
+                if table and self.bodies_data[i].get('row_shown'):
+                    suggested_input = table.getInputAtPosition(i + 1, 1)  # Row 0 is the header
+                    if suggested_input:
+                        suggested_input.value = name
             
             # Update analysis display
             context = self.renamer.naming_engine.analyze_design_context(self.bodies_data)
@@ -581,18 +757,22 @@ class AIRenamerInputChangedHandler(adsk.core.InputChangedEventHandler):
         except Exception as e:
             self.renamer.show_error(f"AI Magic failed: {str(e)}")
     
-    def handle_analyze_design(self, inputs):
+    def handle_analyze_design(self, command_inputs):
         """Handle design analysis request"""
         try:
-            analysis_display = inputs.itemById('analysisResults')
+            analysis_display = command_inputs.itemById('analysisResults')
             
             # Perform comprehensive analysis
             context = self.renamer.naming_engine.analyze_design_context(self.bodies_data)
             
-            # Calculate statistics
-            total_volume = sum(bd.get('properties', {}).get('volume', 0) for bd in self.bodies_data)
-            avg_complexity = sum(1 for bd in self.bodies_data 
-                               if bd.get('properties', {}).get('complexity') == 'complex') / len(self.bodies_data)
+            # Calculate statistics in a single pass
+            total_volume = 0.0
+            complex_count = 0
+            for bd in self.bodies_data:
+                props = bd.get('properties', {})
+                total_volume += props.get('volume', 0)
+                complex_count += props.get('complexity') == 'complex'
+            avg_complexity = complex_count / len(self.bodies_data)
             
             # Generate detailed analysis
             analysis_text = (
@@ -615,6 +795,24 @@ class AIRenamerInputChangedHandler(adsk.core.InputChangedEventHandler):
         except Exception as e:
             self.renamer.show_error(f"Analysis failed: {str(e)}")
     
+    def handle_show_more(self, inputs, show_more_input):
+        """Append the next page of body rows to the rename table"""
+        try:
+            table = inputs.itemById('smartTable')
+            if not table:
+                return
+            
+            end = min(self.rendered_rows + MAX_INLINE_ROWS, len(self.bodies_data))
+            for i in range(self.rendered_rows, end):
+                _add_body_row(table, i, self.bodies_data[i])
+            self.rendered_rows = end
+            
+            if end >= len(self.bodies_data):
+                show_more_input.isVisible = False
+                
+        except Exception as e:
+            self.renamer.show_error(f"Could not show more bodies: {str(e)}")
+    
     def handle_body_preview(self, index: int):
         """Handle body preview in viewport"""
         try:
@@ -649,75 +847,94 @@ class AIRenamerExecuteHandler(adsk.core.CommandExecuteEventHandler):
     def notify(self, args):
         try:
             inputs = args.command.commandInputs
+            # Body i sits in table row i + 1 (row 0 is the header); rows are read by position
+            table = inputs.itemById('smartTable')
             
-            # Apply the renames
-            renamed_count = 0
+            # Read every requested rename from the dialog before touching the model
+            renames = []
             errors = []
             
             for i, body_data in enumerate(self.bodies_data):
                 try:
-                    # Check if body is selected for renaming
-                    select_input = inputs.itemById(f'select_{i}')
-                    if not select_input or not select_input.value:
-                        continue
-                    
-                    # Get the suggested name
-                    suggested_input = inputs.itemById(f'suggested_{i}')
-                    if not suggested_input:
-                        continue
-                    
-                    new_name = suggested_input.value.strip()
-                    if not new_name:
-                        continue
-                    
-                    # Apply the rename
-                    body = body_data['body']
-                    if hasattr(body, 'name'):
-                        old_name = body.name
-                        if new_name != old_name:
-                            body.name = new_name
-                            renamed_count += 1
-                            
+                    if body_data.get('row_shown'):
+                        # A shown row without inputs must not fall back to the AI suggestion,
+                        # or it could override an unchecked box or an edited name
+                        select_input = table.getInputAtPosition(i + 1, 3) if table else None
+                        suggested_input = table.getInputAtPosition(i + 1, 1) if table else None
+                        if not select_input or not suggested_input:
+                            errors.append((i, LookupError('rename row inputs not found')))
+                            continue
+                        if not select_input.value:
+                            continue
+                        new_name = suggested_input.value.strip()
+                    else:
+                        # Rows never shown keep the default selection and use the stored suggestion
+                        new_name = body_data.get('suggested', body_data['name']).strip()
+                    if new_name:
+                        renames.append((i, body_data['body'], new_name))
+                        
                 except Exception as e:
-                    errors.append(f"Body {i}: {str(e)}")
+                    errors.append((i, e))
                     continue
             
-            # Show results with style
+            # Apply the renames in one batch
+            renamed_count, rename_errors, skipped_count = self.renamer.apply_renames(renames)
+            errors.extend(rename_errors)
+            
+            # Show results with style; messages are only built when shown
             if renamed_count > 0:
-                success_msg = (
-                    f"🎉 <b>AI Renaming Complete!</b>\n\n"
-                    f"✅ Successfully renamed {renamed_count} bodies\n"
-                    f"🤖 AI Intelligence: Advanced Pattern Recognition\n"
-                    f"⚡ Speed: Instant (vs. manual: {renamed_count * 30} seconds saved!)\n\n"
-                    f"🚀 Your design is now professionally organized!"
-                )
-                
-                if errors:
-                    success_msg += f"\n\n⚠️ Minor issues with {len(errors)} bodies (see details)"
-                
-                self.renamer.show_success(success_msg)
+                self.renamer.show_success(self._success_message(renamed_count, len(errors), skipped_count))
                 
                 if errors:
-                    error_details = "\n".join(errors[:5])  # Show first 5 errors
-                    self.renamer.show_info(f"Error Details:\n{error_details}")
+                    self.renamer.show_info(f"Error Details:\n{self._format_errors(errors, 5)}")
                     
+            elif skipped_count:
+                self.renamer.show_info(f"Renaming cancelled. {skipped_count} remaining bodies were not renamed.")
             elif errors:
-                self.renamer.show_error(f"Renaming failed for all bodies:\n" + "\n".join(errors[:3]))
+                self.renamer.show_error(f"Renaming failed for all bodies:\n{self._format_errors(errors, 3)}")
             else:
                 self.renamer.show_info("No changes were made. Select bodies and set names to apply changes.")
                 
         except Exception as e:
             self.renamer.show_error(f"Execution failed: {str(e)}")
+    
+    @staticmethod
+    def _success_message(renamed_count: int, error_count: int, skipped_count: int = 0) -> str:
+        """Build the rename summary banner"""
+        headline = "⏹️ <b>AI Renaming Stopped</b>" if skipped_count else "🎉 <b>AI Renaming Complete!</b>"
+        success_msg = (
+            f"{headline}\n\n"
+            f"✅ Successfully renamed {renamed_count} bodies\n"
+            f"🤖 AI Intelligence: Advanced Pattern Recognition\n"
+            f"⚡ Speed: Instant (vs. manual: {renamed_count * 30} seconds saved!)\n\n"
+            f"🚀 Your design is now professionally organized!"
+        )
+        if skipped_count:
+            success_msg += f"\n\n⏹️ Cancelled: {skipped_count} remaining bodies were not renamed"
+        if error_count:
+            success_msg += f"\n\n⚠️ Minor issues with {error_count} bodies (see details)"
+        return success_msg
+    
+    @staticmethod
+    def _format_errors(errors: List[Tuple[int, Exception]], limit: int) -> str:
+        """Format the first few (index, exception) errors for display"""
+        return "\n".join(f"Body {i}: {e}" for i, e in errors[:limit])
 
 class AIRenamerDestroyHandler(adsk.core.CommandDestroyEventHandler):
     """Clean up handler"""
     
-    def __init__(self):
+    def __init__(self, command_handlers: List[Any]):
         super().__init__()
+        # Handlers that belong to this command invocation only
+        self.command_handlers = command_handlers
         
     def notify(self, args):
-        global _handlers
-        _handlers = []
+        # Release this command's handlers; the command-created handler and any
+        # other live command's handlers must stay registered
+        owned = {id(handler) for handler in self.command_handlers}
+        owned.add(id(self))
+        _handlers[:] = [handler for handler in _handlers if id(handler) not in owned]
+        self.command_handlers = []
 
 # External API Integration (for future AI enhancement)
 class ExternalAIConnector:
@@ -744,6 +961,29 @@ class ExternalAIConnector:
         except:
             return []
 
+# Quick Action templates, shared by every call
+_AUTO_NAMES = (
+    'Engine Block', 'Cylinder Head', 'Piston', 'Connecting Rod', 'Crankshaft',
+    'Intake Manifold', 'Exhaust Manifold', 'Oil Pan', 'Valve Cover', 'Timing Cover',
+    'Water Pump', 'Oil Pump', 'Fuel Rail', 'Throttle Body', 'Air Filter Housing'
+)
+_ELEC_NAMES = (
+    'Main PCB', 'Power Supply', 'Control Board', 'Display Module', 'Connector Block',
+    'Heat Sink', 'Cooling Fan', 'Battery Pack', 'Sensor Module', 'Interface Board',
+    'LED Panel', 'Switch Assembly', 'Cable Harness', 'Enclosure Top', 'Enclosure Bottom'
+)
+_FURN_NAMES = (
+    'Table Top', 'Table Leg', 'Drawer Front', 'Drawer Side', 'Drawer Bottom',
+    'Handle', 'Hinge', 'Shelf', 'Side Panel', 'Back Panel',
+    'Support Rail', 'Corner Bracket', 'Foot Pad', 'Edge Trim', 'Reinforcement'
+)
+
+@functools.lru_cache(maxsize=64)
+def _template_names(templates: Tuple[str, ...], fallback: str, count: int) -> Tuple[str, ...]:
+    """Template names in order, then numbered fallback names once they run out"""
+    names = templates[:count]
+    return names + tuple(f"{fallback} {i + 1}" for i in range(len(names), count))
+
 # Quick Action Shortcuts
 class QuickActions:
     """One-click actions for common scenarios"""
@@ -751,53 +991,36 @@ class QuickActions:
     @staticmethod
     def automotive_quick_name(bodies_data: List[Dict]) -> List[str]:
         """Quick automotive naming"""
-        auto_names = [
-            'Engine Block', 'Cylinder Head', 'Piston', 'Connecting Rod', 'Crankshaft',
-            'Intake Manifold', 'Exhaust Manifold', 'Oil Pan', 'Valve Cover', 'Timing Cover',
-            'Water Pump', 'Oil Pump', 'Fuel Rail', 'Throttle Body', 'Air Filter Housing'
-        ]
-        
-        names = []
-        for i, _ in enumerate(bodies_data):
-            if i < len(auto_names):
-                names.append(auto_names[i])
-            else:
-                names.append(f"Auto Part {i + 1}")
-        return names
+        return list(_template_names(_AUTO_NAMES, 'Auto Part', len(bodies_data)))
     
     @staticmethod
     def electronics_quick_name(bodies_data: List[Dict]) -> List[str]:
         """Quick electronics naming"""
-        elec_names = [
-            'Main PCB', 'Power Supply', 'Control Board', 'Display Module', 'Connector Block',
-            'Heat Sink', 'Cooling Fan', 'Battery Pack', 'Sensor Module', 'Interface Board',
-            'LED Panel', 'Switch Assembly', 'Cable Harness', 'Enclosure Top', 'Enclosure Bottom'
-        ]
-        
-        names = []
-        for i, _ in enumerate(bodies_data):
-            if i < len(elec_names):
-                names.append(elec_names[i])
-            else:
-                names.append(f"Electronic Component {i + 1}")
-        return names
+        return list(_template_names(_ELEC_NAMES, 'Electronic Component', len(bodies_data)))
     
     @staticmethod
     def furniture_quick_name(bodies_data: List[Dict]) -> List[str]:
         """Quick furniture naming"""
-        furn_names = [
-            'Table Top', 'Table Leg', 'Drawer Front', 'Drawer Side', 'Drawer Bottom',
-            'Handle', 'Hinge', 'Shelf', 'Side Panel', 'Back Panel',
-            'Support Rail', 'Corner Bracket', 'Foot Pad', 'Edge Trim', 'Reinforcement'
-        ]
-        
-        names = []
-        for i, _ in enumerate(bodies_data):
-            if i < len(furn_names):
-                names.append(furn_names[i])
-            else:
-                names.append(f"Furniture Part {i + 1}")
-        return names
+        return list(_template_names(_FURN_NAMES, 'Furniture Part', len(bodies_data)))
+
+def _startup_message() -> str:
+    """Build the startup banner text"""
+    return (
+        f"🚀 <b>{CONFIG.NAME} {CONFIG.VERSION} - LOADED!</b>\n\n"
+        f"✨ <b>Revolutionary Features Activated:</b>\n"
+        f"• 🤖 One-Click AI Auto-Naming\n"
+        f"• 🧠 Advanced Pattern Recognition\n"
+        f"• 👁️ Visual Body Selection\n"
+        f"• ⚡ Instant Context Analysis\n"
+        f"• 🎯 Smart Industry Templates\n"
+        f"• 🔥 Zero-Effort User Experience\n\n"
+        f"🎮 <b>How to Use:</b>\n"
+        f"1. Click '{CONFIG.NAME}' in Design toolbar\n"
+        f"2. Describe your design (optional)\n"
+        f"3. Click '🪄 AI Auto-Name' \n"
+        f"4. Watch the magic happen!\n\n"
+        f"💡 <b>Pro Tip:</b> Just click 'AI Auto-Name' for instant intelligence!"
+    )
 
 def run(context):
     """Revolutionary add-in startup"""
@@ -811,15 +1034,15 @@ def run(context):
             return
         
         # Remove existing command
-        existing_cmd = _ui.commandDefinitions.itemById(CONFIG['COMMAND_ID'])
+        existing_cmd = _ui.commandDefinitions.itemById(CONFIG.COMMAND_ID)
         if existing_cmd:
             existing_cmd.deleteMe()
         
         # Create revolutionary command
         cmd_def = _ui.commandDefinitions.addButtonDefinition(
-            CONFIG['COMMAND_ID'],
-            CONFIG['NAME'],
-            CONFIG['TOOLTIP'],
+            CONFIG.COMMAND_ID,
+            CONFIG.NAME,
+            CONFIG.TOOLTIP,
             './resources'  # Icon resources folder
         )
         
@@ -829,14 +1052,14 @@ def run(context):
             toolbar_panels = design_workspace.toolbarPanels
             
             # Create or get panel
-            panel = toolbar_panels.itemById(CONFIG['PANEL_ID'])
+            panel = toolbar_panels.itemById(CONFIG.PANEL_ID)
             if not panel:
-                panel = toolbar_panels.add(CONFIG['PANEL_ID'], '🤖 AI Tools')
+                panel = toolbar_panels.add(CONFIG.PANEL_ID, '🤖 AI Tools')
             
             # Add command to panel
             if panel:
                 controls = panel.controls
-                control = controls.itemById(CONFIG['COMMAND_ID'])
+                control = controls.itemById(CONFIG.COMMAND_ID)
                 if not control:
                     control = controls.addCommand(cmd_def)
                     control.isVisible = True
@@ -847,29 +1070,14 @@ def run(context):
         cmd_def.commandCreated.add(cmd_created_handler)
         _handlers.append(cmd_created_handler)
         
-        # Show revolutionary startup message
-        startup_msg = (
-            f"🚀 <b>{CONFIG['NAME']} {CONFIG['VERSION']} - LOADED!</b>\n\n"
-            f"✨ <b>Revolutionary Features Activated:</b>\n"
-            f"• 🤖 One-Click AI Auto-Naming\n"
-            f"• 🧠 Advanced Pattern Recognition\n"
-            f"• 👁️ Visual Body Selection\n"
-            f"• ⚡ Instant Context Analysis\n"
-            f"• 🎯 Smart Industry Templates\n"
-            f"• 🔥 Zero-Effort User Experience\n\n"
-            f"🎮 <b>How to Use:</b>\n"
-            f"1. Click '{CONFIG['NAME']}' in Design toolbar\n"
-            f"2. Describe your design (optional)\n"
-            f"3. Click '🪄 AI Auto-Name' \n"
-            f"4. Watch the magic happen!\n\n"
-            f"💡 <b>Pro Tip:</b> Just click 'AI Auto-Name' for instant intelligence!"
-        )
-        
-        _ui.messageBox(startup_msg)
+        # Show revolutionary startup message (built only when enabled)
+        if CONFIG.SHOW_STARTUP_BANNER:
+            _ui.messageBox(_startup_message())
         
     except Exception as e:
         try:
             if _ui:
+                import traceback
                 _ui.messageBox(f"❌ Revolutionary AI Loader Failed: {str(e)}\n\n{traceback.format_exc()}")
         except:
             print(f"Critical startup error: {str(e)}")
@@ -877,23 +1085,25 @@ def run(context):
 def stop(context):
     """Clean shutdown"""
     try:
-        global _app, _ui, _handlers
+        global _app, _ui
         
         if _ui:
             # Remove command
-            cmd_def = _ui.commandDefinitions.itemById(CONFIG['COMMAND_ID'])
+            cmd_def = _ui.commandDefinitions.itemById(CONFIG.COMMAND_ID)
             if cmd_def:
                 cmd_def.deleteMe()
             
             # Remove panel if empty
             design_workspace = _ui.workspaces.itemById('FusionSolidEnvironment')
             if design_workspace:
-                panel = design_workspace.toolbarPanels.itemById(CONFIG['PANEL_ID'])
+                panel = design_workspace.toolbarPanels.itemById(CONFIG.PANEL_ID)
                 if panel and panel.controls.count == 0:
                     panel.deleteMe()
         
-        # Clear handlers
-        _handlers = []
+        # Clear handlers and cached analysis
+        _handlers.clear()
+        _ANALYSIS_CACHE.clear()
+        _SUGGESTION_CACHE.clear()
         _app = None
         _ui = None
         
@@ -908,8 +1118,9 @@ class PowerUserUtils:
     def export_naming_rules(bodies_data: List[Dict], filename: str):
         """Export current naming rules to JSON for reuse"""
         try:
+            import json
             rules = {
-                'version': CONFIG['VERSION'],
+                'version': CONFIG.VERSION,
                 'timestamp': time.time(),
                 'bodies_count': len(bodies_data),
                 'naming_rules': []
@@ -934,11 +1145,24 @@ class PowerUserUtils:
     def import_naming_rules(filename: str) -> Dict:
         """Import naming rules from JSON"""
         try:
+            import json
             with open(filename, 'r') as f:
                 return json.load(f)
         except:
             return {}
 
+_CREATIVE_NAMES = (
+    'The Spinny Thing', 'Support Buddy', 'Mystery Component', 'Thing-a-ma-jig',
+    'Doohickey Supreme', 'Mechanical Marvel', 'Widget Wonder', 'Gadget Guardian',
+    'The Connector', 'Solid Steve', 'Bendy Bob', 'Sturdy Susan',
+    'Round Robin', 'Square Sam', 'Flat Fred', 'Tall Tom'
+)
+
+@functools.lru_cache(maxsize=64)
+def _cycled_names(templates: Tuple[str, ...], count: int) -> Tuple[str, ...]:
+    """Repeat the templates as often as needed to cover count bodies"""
+    return (templates * (count // len(templates) + 1))[:count]
+
 # Easter Eggs and Fun Features
 class EasterEggs:
     """Fun features to delight users"""
@@ -946,17 +1170,7 @@ class EasterEggs:
     @staticmethod
     def creative_names(bodies_data: List[Dict]) -> List[str]:
         """Generate creative/funny names"""
-        creative = [
-            'The Spinny Thing', 'Support Buddy', 'Mystery Component', 'Thing-a-ma-jig',
-            'Doohickey Supreme', 'Mechanical Marvel', 'Widget Wonder', 'Gadget Guardian',
-            'The Connector', 'Solid Steve', 'Bendy Bob', 'Sturdy Susan',
-            'Round Robin', 'Square Sam', 'Flat Fred', 'Tall Tom'
-        ]
-        
-        names = []
-        for i, _ in enumerate(bodies_data):
-            names.append(creative[i % len(creative)])
-        return names
+        return list(_cycled_names(_CREATIVE_NAMES, len(bodies_data)))
     
     @staticmethod
     def show_achievement(message: str):
@@ -968,29 +1182,41 @@ class EasterEggs:
 class PerformanceMonitor:
     """Monitor add-in performance"""
     
-    def __init__(self):
-        self.start_time = time.time()
-        self.operations = []
+    def __init__(self, capacity: int = 4096):
+        if capacity < 1:
+            raise ValueError(f"capacity must be at least 1, got {capacity}")
+        self.start_time = time.perf_counter()
+        # Ring buffer of the newest operation durations plus a running total
+        self._cap = capacity
+        self._dur = array('d', bytes(8 * capacity))
+        self._n = 0
+        self._sum = 0.0
     
     def log_operation(self, operation: str, duration: float):
         """Log operation performance"""
-        self.operations.append({
-            'operation': operation,
-            'duration': duration,
-            'timestamp': time.time()
-        })
+        i = self._n % self._cap
+        if self._n >= self._cap:
+            self._sum -= self._dur[i]
+        self._dur[i] = duration
+        self._sum += duration
+        self._n += 1
+        
+        # Re-sum the window once per wrap so subtraction rounding never builds up
+        if self._n % self._cap == 0:
+            self._sum = sum(self._dur)
     
     def get_stats(self) -> str:
         """Get performance statistics"""
-        if not self.operations:
+        if not self._n:
             return "No operations logged"
         
-        total_time = sum(op['duration'] for op in self.operations)
-        avg_time = total_time / len(self.operations)
+        count = min(self._n, self._cap)
+        total_time = self._sum
+        avg_time = total_time / count
         
         return (
             f"⚡ Performance Stats:\n"
-            f"• Total Operations: {len(self.operations)}\n"
+            f"• Total Operations: {count}\n"
             f"• Total Time: {total_time:.2f}s\n"
             f"• Average Time: {avg_time:.2f}s\n"
             f"• Efficiency: {'Excellent' if avg_time < 0.1 else 'Good' if avg_time < 0.5 else 'Needs Optimization'}"
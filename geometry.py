@@ -1,67 +1,233 @@
-from dataclasses import dataclass
-from typing import List, Tuple
+from dataclasses import dataclass, field
+from typing import List, Tuple, Dict, Set
+from array import array
 import math
 
-@dataclass
+# Pick index cell size; at least the selection threshold, so the 3x3 cells
+# around a click hold every shape that can be within reach of it
+GRID_CELL_SIZE = 20.0
+
+# Shapes wider than this (or with non-finite coordinates) would fill too many cells;
+# they share one bucket that every pick scans instead
+MAX_INDEXED_EXTENT = 256 * GRID_CELL_SIZE
+_OVERSIZED = None
+
+# Shapes compare by identity (no recursive generated __eq__) and use __slots__
+@dataclass(eq=False, slots=True)
 class Point:
     x: float
     y: float
 
-@dataclass
+@dataclass(eq=False, slots=True)
 class Line:
     start: Point
     end: Point
+    _id: int = field(default=-1, init=False, repr=False)
 
-@dataclass
+@dataclass(eq=False, slots=True)
 class Circle:
     center: Point
     radius: float
+    _id: int = field(default=-1, init=False, repr=False)
 
 class GeometryManager:
     def __init__(self):
-        self.shapes = []
+        # Shapes are stored column-wise (one array per coordinate), with the
+        # dataclass objects kept alongside only to hand back to callers
+        # Lines also keep a*x + b*y + c = 0 with 1/|(a, b)| precomputed for picking
+        self._lines: Dict[str, array] = {'sx': array('d'), 'sy': array('d'),
+                                         'ex': array('d'), 'ey': array('d'),
+                                         'a': array('d'), 'b': array('d'),
+                                         'c': array('d'), 'inv_len': array('d')}
+        self._circles: Dict[str, array] = {'cx': array('d'), 'cy': array('d'), 'r': array('d')}
+        # Every shape by id, in creation order; rows map ids to column positions
+        self._shapes: Dict[int, object] = {}
+        self._next_id = 0
+        self._line_ids: List[int] = []
+        self._circle_ids: List[int] = []
+        self._line_rows: Dict[int, int] = {}
+        self._circle_rows: Dict[int, int] = {}
+        # Uniform grids over shape outlines: cell -> rows whose segment or circumference crosses it,
+        # plus the _OVERSIZED bucket
+        self._line_grid: Dict[Tuple[int, int], Set[int]] = {}
+        self._circle_grid: Dict[Tuple[int, int], Set[int]] = {}
         self.selected_shape = None
     
+    @property
+    def shapes(self) -> list:
+        return list(self._shapes.values())
+    
+    def _register(self, shape, ids: List[int], rows: Dict[int, int]) -> int:
+        shape._id = self._next_id
+        self._next_id += 1
+        self._shapes[shape._id] = shape
+        rows[shape._id] = len(ids)
+        ids.append(shape._id)
+        return rows[shape._id]
+    
     def create_line(self, start_x: float, start_y: float, end_x: float, end_y: float) -> Line:
         line = Line(Point(start_x, start_y), Point(end_x, end_y))
-        self.shapes.append(line)
+        lines = self._lines
+        lines['sx'].append(start_x)
+        lines['sy'].append(start_y)
+        lines['ex'].append(end_x)
+        lines['ey'].append(end_y)
+        a = end_y - start_y
+        b = start_x - end_x
+        length = math.hypot(a, b)
+        if length != 0:
+            lines['a'].append(a)
+            lines['b'].append(b)
+            lines['c'].append(end_x * start_y - end_y * start_x)
+            lines['inv_len'].append(1.0 / length)
+        else:
+            # Degenerate line: distance is always infinite
+            lines['a'].append(0.0)
+            lines['b'].append(0.0)
+            lines['c'].append(float('inf'))
+            lines['inv_len'].append(1.0)
+        row = self._register(line, self._line_ids, self._line_rows)
+        self._index(self._line_grid, row, self._line_cells(row))
         return line
     
     def create_circle(self, center_x: float, center_y: float, radius: float) -> Circle:
         circle = Circle(Point(center_x, center_y), radius)
-        self.shapes.append(circle)
+        circles = self._circles
+        circles['cx'].append(center_x)
+        circles['cy'].append(center_y)
+        circles['r'].append(radius)
+        row = self._register(circle, self._circle_ids, self._circle_rows)
+        self._index(self._circle_grid, row, self._circle_cells(row))
         return circle
     
     def delete_shape(self, shape):
-        if shape in self.shapes:
-            self.shapes.remove(shape)
+        shape_id = getattr(shape, '_id', None)
+        if self._shapes.get(shape_id) is not shape:
+            return
+        del self._shapes[shape_id]
+        
+        if isinstance(shape, Line):
+            columns, ids, rows, grid, cells = (self._lines, self._line_ids, self._line_rows,
+                                               self._line_grid, self._line_cells)
+        else:
+            columns, ids, rows, grid, cells = (self._circles, self._circle_ids, self._circle_rows,
+                                               self._circle_grid, self._circle_cells)
+        row = rows.pop(shape_id)
+        
+        # Move the last row into the freed slot so only that one shape is re-bucketed
+        last = len(ids) - 1
+        self._unindex(grid, row, cells(row))
+        if row != last:
+            self._unindex(grid, last, cells(last))
+            for column in columns.values():
+                column[row] = column[last]
+            ids[row] = ids[last]
+            rows[ids[row]] = row
+            self._index(grid, row, cells(row))
+        for column in columns.values():
+            column.pop()
+        ids.pop()
     
     def select_shape(self, x: float, y: float):
         min_distance = float('inf')
         selected = None
         
-        for shape in self.shapes:
-            if isinstance(shape, Line):
-                dist = self._point_to_line_distance(Point(x, y), shape)
-                if dist < min_distance:
-                    min_distance = dist
-                    selected = shape
-            elif isinstance(shape, Circle):
-                dist = math.sqrt((x - shape.center.x)**2 + (y - shape.center.y)**2)
-                if abs(dist - shape.radius) < min_distance:
-                    min_distance = abs(dist - shape.radius)
-                    selected = shape
+        # Only shapes in the clicked cell and its neighbours can be in reach
+        cell_x = int(x // GRID_CELL_SIZE)
+        cell_y = int(y // GRID_CELL_SIZE)
+        neighbourhood = [(cell_x + dx, cell_y + dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)]
+        neighbourhood.append(_OVERSIZED)
+        
+        # Lines
+        for row in sorted(set().union(*(self._line_grid.get(cell, ()) for cell in neighbourhood))):
+            dist = self._line_distance(row, x, y)
+            if dist < min_distance:
+                min_distance = dist
+                selected = self._shapes[self._line_ids[row]]
+        
+        # Circles: distance to the circumference
+        circles = self._circles
+        for row in sorted(set().union(*(self._circle_grid.get(cell, ()) for cell in neighbourhood))):
+            dist = abs(math.hypot(x - circles['cx'][row], y - circles['cy'][row]) - circles['r'][row])
+            if dist < min_distance:
+                min_distance = dist
+                selected = self._shapes[self._circle_ids[row]]
         
         if min_distance < 5:  # Selection threshold
             self.selected_shape = selected
             return selected
         return None
     
-    def _point_to_line_distance(self, point: Point, line: Line) -> float:
-        numerator = abs((line.end.y - line.start.y) * point.x - 
-                       (line.end.x - line.start.x) * point.y + 
-                       line.end.x * line.start.y - 
-                       line.end.y * line.start.x)
-        denominator = math.sqrt((line.end.y - line.start.y)**2 + 
-                              (line.end.x - line.start.x)**2)
-        return numerator / denominator if denominator != 0 else float('inf')
+    def _line_distance(self, row: int, x: float, y: float) -> float:
+        lines = self._lines
+        a, b, inv_len = lines['a'][row], lines['b'][row], lines['inv_len'][row]
+        if a == 0 and b == 0:
+            return float('inf')  # Degenerate line
+        
+        # Projection onto the segment direction (-b, a), as a fraction of its length
+        sx, sy = lines['sx'][row], lines['sy'][row]
+        t = ((y - sy) * a - (x - sx) * b) * inv_len * inv_len
+        if t <= 0:
+            return math.hypot(x - sx, y - sy)
+        if t >= 1:
+            return math.hypot(x - lines['ex'][row], y - lines['ey'][row])
+        return abs(a * x + b * y + lines['c'][row]) * inv_len
+    
+    def _line_cells(self, row: int):
+        lines = self._lines
+        sx, sy, ex, ey = lines['sx'][row], lines['sy'][row], lines['ex'][row], lines['ey'][row]
+        if not self._fits_grid(max(abs(ex - sx), abs(ey - sy)), sx, sy, ex, ey):
+            yield _OVERSIZED
+            return
+        if sx > ex:
+            sx, sy, ex, ey = ex, ey, sx, sy
+        
+        # Walk the columns the segment crosses, taking the rows of cells its y span covers in each
+        for cell_x in range(int(sx // GRID_CELL_SIZE), int(ex // GRID_CELL_SIZE) + 1):
+            if ex == sx:
+                y0, y1 = sy, ey
+            else:
+                x0 = max(sx, cell_x * GRID_CELL_SIZE)
+                x1 = min(ex, (cell_x + 1) * GRID_CELL_SIZE)
+                y0 = sy if x0 == sx else sy + (x0 - sx) * (ey - sy) / (ex - sx)
+                y1 = ey if x1 == ex else sy + (x1 - sx) * (ey - sy) / (ex - sx)
+            yield from self._column(cell_x, min(y0, y1), max(y0, y1))
+    
+    def _circle_cells(self, row: int):
+        circles = self._circles
+        cx, cy, r = circles['cx'][row], circles['cy'][row], circles['r'][row]
+        if not self._fits_grid(2 * abs(r), cx, cy, r):
+            yield _OVERSIZED
+            return
+        
+        # In each column the upper and lower arcs each span one run of cells
+        for cell_x in range(int((cx - r) // GRID_CELL_SIZE), int((cx + r) // GRID_CELL_SIZE) + 1):
+            x0 = max(cx - r, cell_x * GRID_CELL_SIZE) - cx
+            x1 = min(cx + r, (cell_x + 1) * GRID_CELL_SIZE) - cx
+            near = 0.0 if x0 <= 0 <= x1 else min(abs(x0), abs(x1))
+            far = max(abs(x0), abs(x1))
+            high = math.sqrt(max(r * r - near * near, 0.0))
+            low = math.sqrt(max(r * r - far * far, 0.0))
+            yield from self._column(cell_x, cy + low, cy + high)
+            yield from self._column(cell_x, cy - high, cy - low)
+    
+    @staticmethod
+    def _fits_grid(extent: float, *coords: float) -> bool:
+        return extent <= MAX_INDEXED_EXTENT and all(map(math.isfinite, coords))
+    
+    @staticmethod
+    def _column(cell_x: int, min_y: float, max_y: float):
+        for cell_y in range(int(min_y // GRID_CELL_SIZE), int(max_y // GRID_CELL_SIZE) + 1):
+            yield cell_x, cell_y
+    
+    def _index(self, grid: Dict[Tuple[int, int], Set[int]], row: int, cells):
+        for cell in cells:
+            grid.setdefault(cell, set()).add(row)
+    
+    def _unindex(self, grid: Dict[Tuple[int, int], Set[int]], row: int, cells):
+        for cell in cells:
+            bucket = grid.get(cell)
+            if bucket is not None:
+                bucket.discard(row)
+                if not bucket:
+                    del grid[cell]